@@ -1,67 +1,441 @@
 #!/usr/bin/env python3
+import contextlib
+import io
 import os
-import subprocess
+import re
+import sys
 import click
-import shutil
+
+_COLLECT_RE = re.compile(r'(\d+|no)\s+tests?\s+collected')
+_COLLECT_ERRORS_RE = re.compile(r'(\d+)\s+errors?\b')
+
+_JUNK_DIRS = frozenset({"__pycache__", ".pytest_cache", ".mypy_cache"})
+_JUNK_SUFFIXES = (".pyc", ".pyo")
+
+# Directories mkdoc never enters, in addition to hidden ones
+_MKDOC_PRUNED_DIRS = frozenset({"node_modules", "__pycache__"})
+
+TF_FILES = (
+    (
+        "main.tf",
+        'terraform {\n'
+        '  required_version = ">= 0.12"\n'
+        '  backend "local" {\n'
+        '    path = "terraform.tfstate"\n'
+        '  }\n'
+        '}\n\n'
+        'provider "aws" {\n'
+        '  region = var.region\n'
+        '}\n',
+        "Created main.tf with standard Terraform configuration.",
+    ),
+    (
+        "variables.tf",
+        '// Variable definitions\n'
+        'variable "region" {\n'
+        '  description = "The AWS region"\n'
+        '  type        = string\n'
+        '  default     = "us-east-1"\n'
+        '}\n',
+        "Created variables.tf with variable definitions.",
+    ),
+    (
+        "outputs.tf",
+        '// Output definitions\n'
+        'output "example_output" {\n'
+        '  description = "An example output"\n'
+        '  value       = "Hello, Terraform!"\n'
+        '}\n',
+        "Created outputs.tf with output definitions.",
+    ),
+    (
+        "locals.tf",
+        '// Local values\n'
+        'locals {\n'
+        '  example_local = "This is a local value"\n'
+        '}\n',
+        "Created locals.tf with local value definitions.",
+    ),
+)
+
+DOCKER_FILES = (
+    (
+        "Dockerfile",
+        "FROM python:3.9-slim\n"
+        "WORKDIR /app\n"
+        "COPY . /app\n"
+        "RUN pip install -r requirements.txt\n"
+        "CMD [\"python\", \"app.py\"]\n",
+        "Created Dockerfile.",
+    ),
+    (
+        "docker-compose.yml",
+        "version: '3'\n"
+        "services:\n"
+        "  app:\n"
+        "    build: .\n"
+        "    ports:\n"
+        "      - \"5000:5000\"\n",
+        "Created docker-compose.yml.",
+    ),
+)
+
+SPHINX_CONF_PY = "# Sphinx configuration\n"
+
+MKDOC_HEADER = "# Project Documentation\n\n## Directory Structure"
+
+# Scaffold templates; those with {name}-style placeholders are filled in with str.format
+CLI_MAIN_PY = (
+    "import click\n\n"
+    "@click.command()\n"
+    "def main():\n"
+    "    click.echo('Hello from your CLI tool!')\n\n"
+    "if __name__ == '__main__':\n"
+    "    main()\n"
+)
+
+CLI_TEST_MAIN_PY = (
+    "from main import main\n\n"
+    "def test_main(capsys):\n"
+    "    main()\n"
+    "    captured = capsys.readouterr()\n"
+    "    assert 'Hello from your CLI tool!' in captured.out\n"
+)
+
+CLI_README_MD = "# {name}\n\nA CLI project scaffolded with DevAutomator.\n"
+
+CLI_REQUIREMENTS_TXT = "click\n"
+
+CLI_SETUP_PY = (
+    "from setuptools import setup\n\n"
+    "setup(\n"
+    "    name='{name}',\n"
+    "    version='0.1.0',\n"
+    "    py_modules=['main'],\n"
+    "    install_requires=['click'],\n"
+    "    entry_points={{'console_scripts': [\n"
+    "        '{name}=main:main'\n"
+    "    ]}},\n"
+    ")\n"
+)
+
+REACT_INDEX_HTML = (
+    "<!DOCTYPE html>\n"
+    "<html lang='en'>\n"
+    "<head>\n"
+    "  <meta charset='UTF-8'>\n"
+    "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>\n"
+    "  <title>React App</title>\n"
+    "</head>\n"
+    "<body>\n"
+    "  <div id='root'></div>\n"
+    "  <script src='../src/index.js'></script>\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+REACT_INDEX_JS = (
+    "import React from 'react';\n"
+    "import ReactDOM from 'react-dom';\n\n"
+    "const App = () => <h1>Welcome to your React App!</h1>;\n\n"
+    "ReactDOM.render(<App />, document.getElementById('root'));\n"
+)
+
+REACT_PACKAGE_JSON = (
+    "{{\n"
+    '  "name": "{name}",\n'
+    '  "version": "0.1.0",\n'
+    '  "dependencies": {{\n'
+    '    "react": "^17.0.0",\n'
+    '    "react-dom": "^17.0.0"\n'
+    "  }},\n"
+    '  "scripts": {{\n'
+    '    "start": "echo \\"Run your bundler here\\""\n'
+    "  }}\n"
+    "}}\n"
+)
+
+ANGULAR_APP_COMPONENT_TS = (
+    "import { Component } from '@angular/core';\n\n"
+    "@Component({\n"
+    "  selector: 'app-root',\n"
+    "  template: `<h1>Welcome to your Angular App!</h1>`\n"
+    "})\n"
+    "export class AppComponent {}\n"
+)
+
+ANGULAR_PACKAGE_JSON = (
+    "{{\n"
+    '  "name": "{name}",\n'
+    '  "version": "0.1.0",\n'
+    '  "dependencies": {{\n'
+    '    "@angular/core": "~12.0.0"\n'
+    "  }},\n"
+    '  "scripts": {{\n'
+    '    "start": "echo \\"Run Angular CLI to serve your app\\""\n'
+    "  }}\n"
+    "}}\n"
+)
+
+EXPRESS_INDEX_JS = (
+    "const express = require('express');\n"
+    "const app = express();\n"
+    "const PORT = process.env.PORT || 3000;\n\n"
+    "app.get('/', (req, res) => res.send('Hello from Express!'));\n\n"
+    "app.listen(PORT, () => console.log(`Server running on port ${PORT}`));\n"
+)
+
+EXPRESS_PACKAGE_JSON = (
+    "{{\n"
+    '  "name": "{name}",\n'
+    '  "version": "0.1.0",\n'
+    '  "dependencies": {{\n'
+    '    "express": "^4.17.1"\n'
+    "  }},\n"
+    '  "scripts": {{\n'
+    '    "start": "node index.js"\n'
+    "  }}\n"
+    "}}\n"
+)
+
+NESTJS_MAIN_TS = (
+    "import { NestFactory } from '@nestjs/core';\n"
+    "import { AppModule } from './app.module';\n\n"
+    "async function bootstrap() {\n"
+    "  const app = await NestFactory.create(AppModule);\n"
+    "  await app.listen(3000);\n"
+    "}\n"
+    "bootstrap();\n"
+)
+
+NESTJS_APP_MODULE_TS = (
+    "import { Module } from '@nestjs/common';\n\n"
+    "@Module({\n"
+    "  imports: [],\n"
+    "  controllers: [],\n"
+    "  providers: [],\n"
+    "})\n"
+    "export class AppModule {}\n"
+)
+
+FASTAPI_MAIN_PY = (
+    "from fastapi import FastAPI\n\n"
+    "app = FastAPI()\n\n"
+    "@app.get('/')\n"
+    "def read_root():\n"
+    "    return {'message': 'Hello from FastAPI!'}\n"
+)
+
+FASTAPI_REQUIREMENTS_TXT = "fastapi\nuvicorn\n"
+
+FLASK_APP_PY = (
+    "from flask import Flask\n\n"
+    "app = Flask(__name__)\n\n"
+    "@app.route('/')\n"
+    "def hello():\n"
+    "    return 'Hello from Flask!'\n\n"
+    "if __name__ == '__main__':\n"
+    "    app.run(debug=True)\n"
+)
+
+FLASK_REQUIREMENTS_TXT = "flask\n"
+
+SPRING_README_MD = (
+    "# {name}\n\nThis is a Spring backend project. "
+    "Please use Spring Initializr or your IDE to generate a full project.\n"
+)
+
+TOTE_README_MD = "# {name}\n\nThis backend project uses a custom 'tote' framework. Customize as needed.\n"
+
+GENERIC_README_MD = "# {name}\n\nA new {project_type} project scaffolded with DevAutomator.\n"
 
 def ensure_directory(directory: str) -> None:
     """Ensure that a directory exists, creating it if necessary."""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    try:
+        try:
+            os.mkdir(directory)
+        except FileNotFoundError:
+            # Missing parents (e.g. 'project/docs' for a new project); create the whole path
+            os.makedirs(directory)
         click.echo(f"Created directory '{directory}'.")
-    else:
+    except FileExistsError:
         click.echo(f"Directory '{directory}' already exists.")
 
+def write_files(directory: str, files) -> None:
+    """Write each (relative_path, content) pair under the given directory, in parallel."""
+    from pathlib import Path
+    writes = [(Path(directory, name), content) for name, content in files]
+    if not writes:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    # File writes are independent and release the GIL around the syscalls, so threads suffice
+    with ThreadPoolExecutor(max_workers=min(8, len(writes))) as ex:
+        list(ex.map(lambda pc: pc[0].write_text(pc[1], encoding='utf-8'), writes))
+
 def run_command(command: list, cwd: str = None, check: bool = True) -> None:
+    import subprocess
     try:
-        result = subprocess.run(
-            command, cwd=cwd, capture_output=True, text=True, check=check
+        proc = subprocess.Popen(
+            command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1
         )
-        if result.stdout:
-            click.echo(result.stdout)
-        if result.stderr:
-            click.echo(result.stderr)
-    except subprocess.CalledProcessError as e:
-        click.echo(f"Command '{' '.join(command)}' failed with error:\n{e.stderr}")
     except FileNotFoundError:
         click.echo(f"Command '{command[0]}' not found. Please ensure it is installed.")
+        return
+    # Stream merged stdout/stderr as it arrives instead of buffering the whole output
+    with proc:
+        for line in proc.stdout:
+            click.echo(line, nl=False)
+    if check and proc.returncode != 0:
+        click.echo(f"Command '{' '.join(command)}' failed with exit code {proc.returncode}.")
+
+class _RootdirRecorder:
+    """pytest plugin that records the rootdir of an in-process run."""
+    rootdir = None
+
+    def pytest_configure(self, config):
+        self.rootdir = str(config.rootpath)
+
+def _is_project_module(module, roots):
+    """Return True if a module was loaded from a file under one of roots, outside any installed packages."""
+    filename = getattr(module, "__file__", None)
+    if not filename:
+        return False
+    filename = os.path.abspath(filename)
+    if "site-packages" in filename or "dist-packages" in filename:
+        return False
+    return any(filename == root or filename.startswith(root + os.sep) for root in roots)
+
+def _collect_tests_output(path):
+    """
+    Return the output (stdout and stderr) of a quiet pytest collection, run in-process when
+    pytest is importable. Afterwards, the conftest and test modules imported from the collected
+    path or pytest's rootdir are dropped from sys.modules, and sys.path and sys.meta_path are
+    restored, so a later collection of another path does not hit stale modules.
+    """
+    try:
+        import pytest
+    except ImportError:
+        import subprocess
+        result = subprocess.run(["pytest", "--collect-only", "-q", path],
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        return result.stdout
+    saved_modules = set(sys.modules)
+    saved_path = list(sys.path)
+    saved_meta_path = list(sys.meta_path)
+    recorder = _RootdirRecorder()
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            pytest.main(["--collect-only", "-q", "--no-header", "-p", "no:cacheprovider", path],
+                        plugins=[recorder])
+    except SystemExit:
+        pass
+    finally:
+        roots = {os.path.abspath(path)}
+        if recorder.rootdir:
+            roots.add(os.path.abspath(recorder.rootdir))
+        for name in set(sys.modules) - saved_modules:
+            if _is_project_module(sys.modules[name], roots):
+                del sys.modules[name]
+        sys.path[:] = saved_path
+        sys.meta_path[:] = saved_meta_path
+    return buf.getvalue()
 
 def get_test_metrics(path="."):
-    """Run pytest in collect-only mode and return the total number of tests collected."""
+    """
+    Run pytest in collect-only mode and return the total number of tests collected.
+    Collection errors are reported alongside the count, or in place of it if pytest gave no summary.
+    """
     try:
-        result = subprocess.run(["pytest", "--collect-only", path], capture_output=True, text=True)
-        output = result.stdout.strip()
-        collected = None
+        output = _collect_tests_output(path)
+        # Usage errors (e.g. a missing path) are printed as 'ERROR: ...' next to an empty summary
         for line in output.splitlines():
-            if "collected" in line:
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    if part == "collected" and i + 1 < len(parts):
-                        try:
-                            collected = int(parts[i + 1])
-                            break
-                        except ValueError:
-                            continue
-        return collected if collected is not None else "Unknown"
+            if line.startswith("ERROR: "):
+                return f"Error: {line[len('ERROR: '):]}"
+        m = _COLLECT_RE.search(output)
+        if m is None:
+            lines = [line.strip() for line in output.splitlines() if line.strip()]
+            return f"Error: {lines[-1]}" if lines else "Unknown"
+        count = 0 if m.group(1) == "no" else int(m.group(1))
+        summary = output[m.start():].split("\n", 1)[0]
+        errors = _COLLECT_ERRORS_RE.search(summary)
+        if errors:
+            return f"{count} ({errors.group(1)} collection error(s))"
+        return count
     except Exception as e:
         return f"Error: {e}"
 
 def get_git_metrics():
     """If in a Git repo, return the current branch and count of uncommitted changes."""
-    if not os.path.exists(".git"):
-        return None, None
+    import subprocess
     try:
-        branch_result = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                                       capture_output=True, text=True)
-        branch = branch_result.stdout.strip()
-        status_result = subprocess.run(["git", "status", "--porcelain"],
-                                       capture_output=True, text=True)
-        changes = status_result.stdout.strip().splitlines()
-        changes_count = len(changes)
+        # A single 'status --branch' call reports both the branch header and the changed paths
+        result = subprocess.run(["git", "status", "--branch", "--porcelain=v1"],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        if result.returncode != 0:
+            return None, None
+        lines = result.stdout.splitlines()
+        header = lines[0][3:] if lines and lines[0].startswith("## ") else ""
+        branch = header.split("...")[0]
+        for prefix in ("No commits yet on ", "Initial commit on "):
+            if branch.startswith(prefix):
+                branch = branch[len(prefix):]
+        if branch.startswith("HEAD (no branch)"):
+            branch = "HEAD"
+        changes_count = len(lines) - 1 if header else len(lines)
         return branch, changes_count
     except Exception:
         return None, None
 
+def _latest_pypi_version(name):
+    """Return the latest version of a package published on PyPI, or None if it cannot be fetched."""
+    import json
+    import urllib.request
+    try:
+        with urllib.request.urlopen(f"https://pypi.org/pypi/{name}/json", timeout=5) as resp:
+            return json.load(resp)["info"]["version"]
+    except Exception:
+        return None
+
+def get_outdated_packages():
+    """
+    Compare the distributions installed in the running interpreter's environment against PyPI,
+    querying packages concurrently. Returns a tuple of (outdated, unchecked, checked_count), where
+    outdated is a sorted list of (name, installed_version, latest_version) and unchecked lists the
+    packages whose latest version could not be fetched.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from importlib.metadata import distributions
+    try:
+        from packaging.version import parse as parse_version
+    except ImportError:
+        parse_version = None
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.setdefault(name, dist.version)
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        latest_versions = dict(zip(installed, ex.map(_latest_pypi_version, installed)))
+    outdated = []
+    unchecked = []
+    for name in sorted(installed, key=str.lower):
+        version, latest = installed[name], latest_versions[name]
+        if latest is None:
+            unchecked.append(name)
+            continue
+        if latest == version:
+            continue
+        if parse_version is not None:
+            try:
+                if parse_version(latest) <= parse_version(version):
+                    continue
+            except Exception:
+                pass
+        outdated.append((name, version, latest))
+    return outdated, unchecked, len(installed) - len(unchecked)
+
 def get_doc_status(project_path="."):
     """Check if documentation is set up (i.e. docs folder with conf.py exists)."""
     docs_dir = os.path.join(project_path, 'docs')
@@ -74,35 +448,175 @@ def get_doc_status(project_path="."):
     else:
         return "Documentation not set up."
 
-def cleanup_project(path="."):
+def _iter_cleanup(root, max_depth=None):
+    """
+    Scan the tree under root with os.scandir and return (junk_directories, junk_files).
+    Symlinked directories are never followed, and with max_depth set, directories more than
+    max_depth levels below root are not entered.
+    """
+    junk_dirs = []
+    junk_files = []
+    # Bind hot-loop lookups to locals once for the whole scan
+    add_dir = junk_dirs.append
+    add_file = junk_files.append
+    junk_names = _JUNK_DIRS
+    junk_suffixes = _JUNK_SUFFIXES
+    scandir = os.scandir
+    pending = [(root, 0)]
+    pop = pending.pop
+    push = pending.append
+    while pending:
+        current, depth = pop()
+        descend = max_depth is None or depth < max_depth
+        try:
+            with scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in junk_names:
+                            add_dir(entry.path)
+                        elif descend:
+                            push((entry.path, depth + 1))
+                    elif entry.name.endswith(junk_suffixes):
+                        add_file(entry.path)
+        except OSError as e:
+            click.echo(f"Error scanning directory {current}: {e}")
+    return junk_dirs, junk_files
+
+def _iter_doc_tree(root, max_depth=None, exclude=frozenset()):
+    """
+    Walk the tree under root with os.scandir, yielding (relative_path, dirs, files) per directory
+    in sorted pre-order. Hidden and dependency directories are pruned and never entered, symlinked
+    directories are listed but not followed, and with max_depth set, directories more than
+    max_depth levels below root are not entered. Files whose root-relative path is in exclude
+    are left out.
+    """
+    pending = [(root, ".", 0)]
+    while pending:
+        path, rel_path, depth = pending.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        dirs = []
+        files = []
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                if name.startswith('.') or name in _MKDOC_PRUNED_DIRS:
+                    continue
+                dirs.append(name)
+                if not entry.is_symlink() and (max_depth is None or depth < max_depth):
+                    subdirs.append((entry.path, name if rel_path == "." else os.path.join(rel_path, name),
+                                    depth + 1))
+            elif not exclude or (name if rel_path == "." else os.path.join(rel_path, name)) not in exclude:
+                files.append(name)
+        yield rel_path, dirs, files
+        pending.extend(reversed(subdirs))
+
+def _git_ls_files():
+    """
+    Return (files, linked_dirs) for the current repo: the tracked and untracked-but-not-ignored
+    files present on disk, and the paths of submodules (gitlinks) and symlinks to directories.
+    Returns None on failure.
+    """
+    import subprocess
+    try:
+        # -t tags each record: '?' untracked, 'R' deleted from the working tree, others in the index.
+        # -s adds the index mode: 160000 for submodules, 120000 for symlinks.
+        out = subprocess.check_output(
+            ["git", "ls-files", "-z", "-t", "-s", "--cached", "--others", "--deleted",
+             "--exclude-standard"],
+            stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    files = set()
+    deleted = set()
+    linked_dirs = set()
+    for record in out.split(b"\x00"):
+        if not record:
+            continue
+        tag, rest = record[:1], record[2:]
+        if tag == b"?":
+            # Untracked entries carry no mode, so symlinks among them need a stat
+            path = os.fsdecode(rest)
+            (linked_dirs if os.path.islink(path) and os.path.isdir(path) else files).add(path)
+            continue
+        meta, _, path = rest.partition(b"\t")
+        path = os.fsdecode(path)
+        if tag == b"R":
+            deleted.add(path)
+        elif meta.startswith(b"160000 ") or (meta.startswith(b"120000 ") and os.path.isdir(path)):
+            linked_dirs.add(path)
+        else:
+            files.add(path)
+    return files - deleted, linked_dirs - deleted
+
+def _iter_git_doc_tree(files, linked_dirs=(), max_depth=None, exclude=frozenset()):
+    """
+    Build a directory tree from git's '/'-separated paths and yield (relative_path, dirs, files)
+    per directory in the same sorted pre-order and with the same pruning, depth limit and
+    exclusions as _iter_doc_tree. Submodules and symlinked directories are listed as directories
+    but not entered. Unlike the filesystem walk, directories without any non-ignored files
+    (including empty ones) do not appear, since git only knows about files.
+    """
+    tree = ({}, set(), set())
+    files = [p for p in files if os.path.normpath(p) not in exclude]
+    for path, is_link in [(p, False) for p in files] + [(p, True) for p in linked_dirs]:
+        *parents, name = path.split("/")
+        subdirs, names, links = tree
+        for part in parents:
+            if part.startswith('.') or part in _MKDOC_PRUNED_DIRS:
+                break
+            subdirs, names, links = subdirs.setdefault(part, ({}, set(), set()))
+        else:
+            if not is_link:
+                names.add(name)
+            elif not name.startswith('.') and name not in _MKDOC_PRUNED_DIRS:
+                links.add(name)
+    pending = [(tree, ".", 0)]
+    while pending:
+        (subdirs, names, links), rel_path, depth = pending.pop()
+        yield rel_path, sorted(links.union(subdirs)), sorted(names)
+        if max_depth is None or depth < max_depth:
+            pending.extend(
+                (subdirs[d], d if rel_path == "." else os.path.join(rel_path, d), depth + 1)
+                for d in sorted(subdirs, reverse=True))
+
+def _safe_rmtree(path):
+    import shutil
+    try:
+        shutil.rmtree(path)
+        return path, True
+    except Exception as e:
+        click.echo(f"Error removing directory {path}: {e}")
+        return path, False
+
+def _safe_remove(path):
+    try:
+        os.remove(path)
+        return path, True
+    except Exception as e:
+        click.echo(f"Error removing file {path}: {e}")
+        return path, False
+
+def cleanup_project(path=".", max_depth=None):
     """
     Recursively remove common temporary files and directories:
       - Directories: __pycache__, .pytest_cache, .mypy_cache
       - Files: *.pyc, *.pyo
+    Symlinked directories are not followed; max_depth limits how many levels below path are scanned.
     Returns a tuple of (removed_directories, removed_files).
     """
-    removed_dirs = []
-    removed_files = []
-    for root, dirs, files in os.walk(path):
-        # Remove unwanted directories
-        for d in list(dirs):
-            if d in ("__pycache__", ".pytest_cache", ".mypy_cache"):
-                full_dir = os.path.join(root, d)
-                try:
-                    shutil.rmtree(full_dir)
-                    removed_dirs.append(full_dir)
-                    dirs.remove(d) 
-                except Exception as e:
-                    click.echo(f"Error removing directory {full_dir}: {e}")
-        # Remove unwanted files
-        for file in files:
-            if file.endswith(".pyc") or file.endswith(".pyo"):
-                full_file = os.path.join(root, file)
-                try:
-                    os.remove(full_file)
-                    removed_files.append(full_file)
-                except Exception as e:
-                    click.echo(f"Error removing file {full_file}: {e}")
+    from concurrent.futures import ThreadPoolExecutor
+    junk_dirs, junk_files = _iter_cleanup(path, max_depth)
+    # Removals are independent, I/O-bound and release the GIL, so run them on a thread pool
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        dir_results = list(ex.map(_safe_rmtree, junk_dirs))
+        file_results = list(ex.map(_safe_remove, junk_files))
+    removed_dirs = [p for p, ok in dir_results if ok]
+    removed_files = [p for p, ok in file_results if ok]
     return removed_dirs, removed_files
 
 @click.group(context_settings={'help_option_names': ['-h', '--help']})
@@ -142,64 +656,34 @@ For detailed help on any command, run: \n
 
 @cli.command()
 @click.argument('project_name')
-def tf(project_name):
+@click.option('--and-plan', is_flag=True,
+              help="Run 'terraform init && terraform plan' in a single shell invocation.")
+def tf(project_name, and_plan):
     """
     Initialize a Terraform project by creating a directory and standard Terraform configuration files:
       - main.tf
       - variables.tf
       - outputs.tf
       - locals.tf
-    Then run 'terraform init'.
+    Then run 'terraform init'. With --and-plan, 'terraform plan' is chained onto init in the
+    same shell so the freshly initialized plugin state is reused. The shell command itself is a
+    fixed string; the project directory is only passed as the working directory, never interpolated.
 
     Example:
       devautomator tf my_project
+      devautomator tf my_project --and-plan
     """
     ensure_directory(project_name)
-    main_tf = os.path.join(project_name, "main.tf")
-    variables_tf = os.path.join(project_name, "variables.tf")
-    outputs_tf = os.path.join(project_name, "outputs.tf")
-    locals_tf = os.path.join(project_name, "locals.tf")
-    with open(main_tf, 'w') as f:
-        f.write(
-            'terraform {\n'
-            '  required_version = ">= 0.12"\n'
-            '  backend "local" {\n'
-            '    path = "terraform.tfstate"\n'
-            '  }\n'
-            '}\n\n'
-            'provider "aws" {\n'
-            '  region = var.region\n'
-            '}\n'
-        )
-    click.echo("Created main.tf with standard Terraform configuration.")
-    with open(variables_tf, 'w') as f:
-        f.write(
-            '// Variable definitions\n'
-            'variable "region" {\n'
-            '  description = "The AWS region"\n'
-            '  type        = string\n'
-            '  default     = "us-east-1"\n'
-            '}\n'
-        )
-    click.echo("Created variables.tf with variable definitions.")
-    with open(outputs_tf, 'w') as f:
-        f.write(
-            '// Output definitions\n'
-            'output "example_output" {\n'
-            '  description = "An example output"\n'
-            '  value       = "Hello, Terraform!"\n'
-            '}\n'
-        )
-    click.echo("Created outputs.tf with output definitions.")
-    with open(locals_tf, 'w') as f:
-        f.write(
-            '// Local values\n'
-            'locals {\n'
-            '  example_local = "This is a local value"\n'
-            '}\n'
-        )
-    click.echo("Created locals.tf with local value definitions.")
-    run_command(["terraform", "init"], cwd=project_name)
+    write_files(project_name, ((name, content) for name, content, _ in TF_FILES))
+    click.echo("\n".join(msg for _, _, msg in TF_FILES))
+    if and_plan:
+        import subprocess
+        result = subprocess.run("terraform init && terraform plan", shell=True,
+                                cwd=project_name, check=False)
+        if result.returncode != 0:
+            click.echo(f"Command 'terraform init && terraform plan' failed with exit code {result.returncode}.")
+    else:
+        run_command(["terraform", "init"], cwd=project_name)
 
 @cli.command()
 @click.argument('project_name')
@@ -211,27 +695,8 @@ def docker(project_name):
       devautomator docker my_docker_project
     """
     ensure_directory(project_name)
-    dockerfile_path = os.path.join(project_name, 'Dockerfile')
-    with open(dockerfile_path, 'w') as f:
-        f.write(
-            "FROM python:3.9-slim\n"
-            "WORKDIR /app\n"
-            "COPY . /app\n"
-            "RUN pip install -r requirements.txt\n"
-            "CMD [\"python\", \"app.py\"]\n"
-        )
-    click.echo("Created Dockerfile.")
-    compose_path = os.path.join(project_name, 'docker-compose.yml')
-    with open(compose_path, 'w') as f:
-        f.write(
-            "version: '3'\n"
-            "services:\n"
-            "  app:\n"
-            "    build: .\n"
-            "    ports:\n"
-            "      - \"5000:5000\"\n"
-        )
-    click.echo("Created docker-compose.yml.")
+    write_files(project_name, ((name, content) for name, content, _ in DOCKER_FILES))
+    click.echo("\n".join(msg for _, _, msg in DOCKER_FILES))
 
 @cli.command()
 @click.argument('env_name')
@@ -265,25 +730,51 @@ def doc(project_name):
     Example:
       devautomator doc my_project
     """
+    from pathlib import Path
     docs_dir = os.path.join(project_name, 'docs')
     ensure_directory(docs_dir)
-    sphinx_conf = os.path.join(docs_dir, 'conf.py')
-    with open(sphinx_conf, 'w') as f:
-        f.write("# Sphinx configuration\n")
+    Path(docs_dir, 'conf.py').write_text(SPHINX_CONF_PY, encoding='utf-8')
     click.echo("Created Sphinx configuration file 'conf.py'.")
     click.echo("You can now build your docs using 'sphinx-build'.")
 
 @cli.command()
 @click.argument('project_name')
-def dep(project_name):
+@click.option('--pip', 'use_pip', is_flag=True,
+              help="Use the 'pip' on PATH ('pip list --outdated') instead of querying PyPI for "
+                   "DevAutomator's own environment.")
+def dep(project_name, use_pip):
     """
     Check for outdated Python dependencies for a project.
+    Packages installed in the environment DevAutomator itself runs in are read in-process and
+    checked against PyPI concurrently. If DevAutomator is installed globally or with pipx, that is
+    not your project's environment; pass --pip to check the environment of the 'pip' on PATH instead.
 
     Example:
       devautomator dep my_project
+      devautomator dep my_project --pip
     """
     click.echo(f"Checking outdated dependencies for project '{project_name}'...")
-    run_command(["pip", "list", "--outdated"])
+    if use_pip:
+        run_command(["pip", "list", "--outdated"])
+        return
+    click.echo(f"Checking packages installed for {sys.executable}")
+    outdated, unchecked, checked_count = get_outdated_packages()
+    if unchecked and not checked_count:
+        click.echo(f"Error: could not fetch version information from PyPI for any of the "
+                   f"{len(unchecked)} installed packages. Check your network connection or use --pip.")
+        return
+    if outdated:
+        rows = [("Package", "Version", "Latest")] + outdated
+        name_width = max(len(row[0]) for row in rows)
+        version_width = max(len(row[1]) for row in rows)
+        click.echo("\n".join(f"{name:<{name_width}}  {version:<{version_width}}  {latest}"
+                             for name, version, latest in rows))
+    elif unchecked:
+        click.echo(f"All {checked_count} checked dependencies are up to date.")
+    else:
+        click.echo("All dependencies are up to date.")
+    if unchecked:
+        click.echo(f"Could not check {len(unchecked)} package(s): {', '.join(unchecked)}")
 
 @cli.command()
 @click.argument('project_name')
@@ -306,44 +797,14 @@ def scaffold(project_name):
     project_type = click.prompt("What type of project is this?", 
                                 type=click.Choice(['cli', 'web', 'generic'], case_sensitive=False))
     if project_type.lower() == "cli":
-        main_file = os.path.join(project_name, 'main.py')
-        with open(main_file, 'w') as f:
-            f.write(
-                "import click\n\n"
-                "@click.command()\n"
-                "def main():\n"
-                "    click.echo('Hello from your CLI tool!')\n\n"
-                "if __name__ == '__main__':\n"
-                "    main()\n"
-            )
-        tests_dir = os.path.join(project_name, 'tests')
-        ensure_directory(tests_dir)
-        test_file = os.path.join(tests_dir, 'test_main.py')
-        with open(test_file, 'w') as f:
-            f.write(
-                "from main import main\n\n"
-                "def test_main(capsys):\n"
-                "    main()\n"
-                "    captured = capsys.readouterr()\n"
-                "    assert 'Hello from your CLI tool!' in captured.out\n"
-            )
-        with open(os.path.join(project_name, 'README.md'), 'w') as f:
-            f.write(f"# {project_name}\n\nA CLI project scaffolded with DevAutomator.\n")
-        with open(os.path.join(project_name, 'requirements.txt'), 'w') as f:
-            f.write("click\n")
-        with open(os.path.join(project_name, 'setup.py'), 'w') as f:
-            f.write(
-                "from setuptools import setup\n\n"
-                "setup(\n"
-                f"    name='{project_name}',\n"
-                "    version='0.1.0',\n"
-                "    py_modules=['main'],\n"
-                "    install_requires=['click'],\n"
-                "    entry_points={'console_scripts': [\n"
-                f"        '{project_name}=main:main'\n"
-                "    ]},\n"
-                ")\n"
-            )
+        ensure_directory(os.path.join(project_name, 'tests'))
+        write_files(project_name, (
+            ('main.py', CLI_MAIN_PY),
+            (os.path.join('tests', 'test_main.py'), CLI_TEST_MAIN_PY),
+            ('README.md', CLI_README_MD.format(name=project_name)),
+            ('requirements.txt', CLI_REQUIREMENTS_TXT),
+            ('setup.py', CLI_SETUP_PY.format(name=project_name)),
+        ))
         click.echo("CLI project scaffolded successfully.")
     elif project_type.lower() == "web":
         app_type = click.prompt("Is your web project a frontend or backend app?",
@@ -354,190 +815,107 @@ def scaffold(project_name):
             if framework.lower() == "react":
                 ensure_directory(os.path.join(project_name, "public"))
                 ensure_directory(os.path.join(project_name, "src"))
-                with open(os.path.join(project_name, "public", "index.html"), 'w') as f:
-                    f.write(
-                        "<!DOCTYPE html>\n"
-                        "<html lang='en'>\n"
-                        "<head>\n"
-                        "  <meta charset='UTF-8'>\n"
-                        "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>\n"
-                        "  <title>React App</title>\n"
-                        "</head>\n"
-                        "<body>\n"
-                        "  <div id='root'></div>\n"
-                        "  <script src='../src/index.js'></script>\n"
-                        "</body>\n"
-                        "</html>\n"
-                    )
-                with open(os.path.join(project_name, "src", "index.js"), 'w') as f:
-                    f.write(
-                        "import React from 'react';\n"
-                        "import ReactDOM from 'react-dom';\n\n"
-                        "const App = () => <h1>Welcome to your React App!</h1>;\n\n"
-                        "ReactDOM.render(<App />, document.getElementById('root'));\n"
-                    )
-                with open(os.path.join(project_name, "package.json"), 'w') as f:
-                    f.write(
-                        "{\n"
-                        f'  "name": "{project_name}",\n'
-                        '  "version": "0.1.0",\n'
-                        '  "dependencies": {\n'
-                        '    "react": "^17.0.0",\n'
-                        '    "react-dom": "^17.0.0"\n'
-                        "  },\n"
-                        '  "scripts": {\n'
-                        '    "start": "echo \\"Run your bundler here\\""\n'
-                        "  }\n"
-                        "}\n"
-                    )
+                write_files(project_name, (
+                    (os.path.join("public", "index.html"), REACT_INDEX_HTML),
+                    (os.path.join("src", "index.js"), REACT_INDEX_JS),
+                    ("package.json", REACT_PACKAGE_JSON.format(name=project_name)),
+                ))
                 click.echo("React frontend project scaffolded successfully.")
             elif framework.lower() == "angular":
                 ensure_directory(os.path.join(project_name, "src"))
-                with open(os.path.join(project_name, "src", "app.component.ts"), 'w') as f:
-                    f.write(
-                        "import { Component } from '@angular/core';\n\n"
-                        "@Component({\n"
-                        "  selector: 'app-root',\n"
-                        "  template: `<h1>Welcome to your Angular App!</h1>`\n"
-                        "})\n"
-                        "export class AppComponent {}\n"
-                    )
-                with open(os.path.join(project_name, "package.json"), 'w') as f:
-                    f.write(
-                        "{\n"
-                        f'  "name": "{project_name}",\n'
-                        '  "version": "0.1.0",\n'
-                        '  "dependencies": {\n'
-                        '    "@angular/core": "~12.0.0"\n'
-                        "  },\n"
-                        '  "scripts": {\n'
-                        '    "start": "echo \\"Run Angular CLI to serve your app\\""\n'
-                        "  }\n"
-                        "}\n"
-                    )
+                write_files(project_name, (
+                    (os.path.join("src", "app.component.ts"), ANGULAR_APP_COMPONENT_TS),
+                    ("package.json", ANGULAR_PACKAGE_JSON.format(name=project_name)),
+                ))
                 click.echo("Angular frontend project scaffolded successfully.")
         elif app_type.lower() == "backend":
             backend_framework = click.prompt("Which backend framework do you want? (express, nestjs, fastapi, flask, spring, tote)",
                                              type=click.Choice(['express', 'nestjs', 'fastapi', 'flask', 'spring', 'tote'], case_sensitive=False))
             if backend_framework.lower() == "express":
-                with open(os.path.join(project_name, "index.js"), 'w') as f:
-                    f.write(
-                        "const express = require('express');\n"
-                        "const app = express();\n"
-                        "const PORT = process.env.PORT || 3000;\n\n"
-                        "app.get('/', (req, res) => res.send('Hello from Express!'));\n\n"
-                        "app.listen(PORT, () => console.log(`Server running on port ${PORT}`));\n"
-                    )
-                with open(os.path.join(project_name, "package.json"), 'w') as f:
-                    f.write(
-                        "{\n"
-                        f'  "name": "{project_name}",\n'
-                        '  "version": "0.1.0",\n'
-                        '  "dependencies": {\n'
-                        '    "express": "^4.17.1"\n'
-                        "  },\n"
-                        '  "scripts": {\n'
-                        '    "start": "node index.js"\n'
-                        "  }\n"
-                        "}\n"
-                    )
+                write_files(project_name, (
+                    ("index.js", EXPRESS_INDEX_JS),
+                    ("package.json", EXPRESS_PACKAGE_JSON.format(name=project_name)),
+                ))
                 click.echo("Express backend project scaffolded successfully.")
             elif backend_framework.lower() == "nestjs":
-                with open(os.path.join(project_name, "main.ts"), 'w') as f:
-                    f.write(
-                        "import { NestFactory } from '@nestjs/core';\n"
-                        "import { AppModule } from './app.module';\n\n"
-                        "async function bootstrap() {\n"
-                        "  const app = await NestFactory.create(AppModule);\n"
-                        "  await app.listen(3000);\n"
-                        "}\n"
-                        "bootstrap();\n"
-                    )
-                with open(os.path.join(project_name, "app.module.ts"), 'w') as f:
-                    f.write(
-                        "import { Module } from '@nestjs/common';\n\n"
-                        "@Module({\n"
-                        "  imports: [],\n"
-                        "  controllers: [],\n"
-                        "  providers: [],\n"
-                        "})\n"
-                        "export class AppModule {}\n"
-                    )
+                write_files(project_name, (
+                    ("main.ts", NESTJS_MAIN_TS),
+                    ("app.module.ts", NESTJS_APP_MODULE_TS),
+                ))
                 click.echo("NestJS backend project scaffolded successfully.")
             elif backend_framework.lower() == "fastapi":
-                with open(os.path.join(project_name, "main.py"), 'w') as f:
-                    f.write(
-                        "from fastapi import FastAPI\n\n"
-                        "app = FastAPI()\n\n"
-                        "@app.get('/')\n"
-                        "def read_root():\n"
-                        "    return {'message': 'Hello from FastAPI!'}\n"
-                    )
-                with open(os.path.join(project_name, "requirements.txt"), 'w') as f:
-                    f.write("fastapi\nuvicorn\n")
+                write_files(project_name, (
+                    ("main.py", FASTAPI_MAIN_PY),
+                    ("requirements.txt", FASTAPI_REQUIREMENTS_TXT),
+                ))
                 click.echo("FastAPI backend project scaffolded successfully.")
             elif backend_framework.lower() == "flask":
-                with open(os.path.join(project_name, "app.py"), 'w') as f:
-                    f.write(
-                        "from flask import Flask\n\n"
-                        "app = Flask(__name__)\n\n"
-                        "@app.route('/')\n"
-                        "def hello():\n"
-                        "    return 'Hello from Flask!'\n\n"
-                        "if __name__ == '__main__':\n"
-                        "    app.run(debug=True)\n"
-                    )
-                with open(os.path.join(project_name, "requirements.txt"), 'w') as f:
-                    f.write("flask\n")
+                write_files(project_name, (
+                    ("app.py", FLASK_APP_PY),
+                    ("requirements.txt", FLASK_REQUIREMENTS_TXT),
+                ))
                 click.echo("Flask backend project scaffolded successfully.")
             elif backend_framework.lower() == "spring":
-                with open(os.path.join(project_name, "README.md"), 'w') as f:
-                    f.write(f"# {project_name}\n\nThis is a Spring backend project. Please use Spring Initializr or your IDE to generate a full project.\n")
+                write_files(project_name, (
+                    ("README.md", SPRING_README_MD.format(name=project_name)),
+                ))
                 click.echo("Spring backend project scaffolded (README only).")
             elif backend_framework.lower() == "tote":
-                with open(os.path.join(project_name, "README.md"), 'w') as f:
-                    f.write(f"# {project_name}\n\nThis backend project uses a custom 'tote' framework. Customize as needed.\n")
+                write_files(project_name, (
+                    ("README.md", TOTE_README_MD.format(name=project_name)),
+                ))
                 click.echo("Tote backend project scaffolded (README only).")
         click.echo("Web project scaffolded successfully.")
     else:
-        with open(os.path.join(project_name, 'README.md'), 'w') as f:
-            f.write(f"# {project_name}\n\nA new {project_type} project scaffolded with DevAutomator.\n")
-        with open(os.path.join(project_name, 'requirements.txt'), 'w') as f:
-            f.write("")
+        write_files(project_name, (
+            ('README.md', GENERIC_README_MD.format(name=project_name, project_type=project_type)),
+            ('requirements.txt', ""),
+        ))
         click.echo("Generic project scaffolded successfully.")
     click.echo("Project scaffolded successfully.")
 
 @cli.command()
-def mkdoc():
+@click.option('--max-depth', type=click.IntRange(min=0), default=None,
+              help="Maximum number of directory levels to descend below the current directory.")
+def mkdoc(max_depth):
     """
     Generate a Markdown documentation file (README_generated.md) for the current project
-    by scanning all folders and files in the current directory.
+    by scanning all folders and files in the current directory. Inside a Git repository the
+    listing comes from 'git ls-files', so paths ignored by .gitignore are left out.
 
     Example:
       devautomator mkdoc
+      devautomator mkdoc --max-depth 2
     """
     output_file = "README_generated.md"
-    tree_lines = ["# Project Documentation", "", "## Directory Structure", ""]
-    for root, dirs, files in os.walk("."):
-        # Skip hidden directories/files like .git
-        if any(part.startswith('.') for part in root.split(os.sep)):
-            continue
-        rel_path = os.path.relpath(root, ".")
-        tree_lines.append(f"### {rel_path}")
-        # List directories
-        for d in sorted(dirs):
-            tree_lines.append(f"- **Directory:** {d}")
-        # List files
-        for f in sorted(files):
-            tree_lines.append(f"- File: {f}")
-        tree_lines.append("") 
-    content = "\n".join(tree_lines)
-    with open(output_file, "w") as f:
-        f.write(content)
+    # Inside a git repo, let git enumerate the non-ignored paths instead of walking the filesystem
+    # The output file is created before the lazy walk runs; keep it out of the listing in both modes
+    exclude = frozenset({output_file})
+    git_paths = _git_ls_files() if os.path.isdir(".git") else None
+    if git_paths is not None:
+        files, linked_dirs = git_paths
+        doc_tree = _iter_git_doc_tree(files, linked_dirs, max_depth, exclude)
+    else:
+        doc_tree = _iter_doc_tree(".", max_depth, exclude)
+    # Stream each directory section straight to the file so memory does not grow with tree size
+    with open(output_file, "w", encoding="utf-8") as fh:
+        write = fh.write
+        join_lines = "\n".join
+        write(MKDOC_HEADER)
+        for rel_path, dirs, files in doc_tree:
+            tree_lines = [f"\n\n### {rel_path}"]
+            # List directories
+            tree_lines.extend(f"- **Directory:** {d}" for d in dirs)
+            # List files
+            tree_lines.extend(f"- File: {f}" for f in files)
+            write(join_lines(tree_lines))
+        write("\n")
     click.echo(f"Documentation generated and saved to {output_file}.")
 
 @cli.command()
-def cleanup():
+@click.option('--max-depth', type=click.IntRange(min=0), default=None,
+              help="Maximum number of directory levels to descend below the current directory.")
+def cleanup(max_depth):
     """
     Clean up temporary files and directories from the project directory.
     This command recursively removes common unwanted directories (e.g. __pycache__,
@@ -545,20 +923,17 @@ def cleanup():
 
     Example:
       devautomator cleanup
+      devautomator cleanup --max-depth 3
     """
     target_path = "."
     click.echo(f"Cleaning up temporary files in '{target_path}'...")
-    removed_dirs, removed_files = cleanup_project(target_path)
+    removed_dirs, removed_files = cleanup_project(target_path, max_depth)
     if removed_dirs:
-        click.echo("Removed directories:")
-        for d in removed_dirs:
-            click.echo(f"  - {d}")
+        click.echo("Removed directories:\n" + "\n".join(f"  - {d}" for d in removed_dirs))
     else:
         click.echo("No temporary directories found to remove.")
     if removed_files:
-        click.echo("Removed files:")
-        for f in removed_files:
-            click.echo(f"  - {f}")
+        click.echo("Removed files:\n" + "\n".join(f"  - {f}" for f in removed_files))
     else:
         click.echo("No temporary files found to remove.")
     click.echo("Cleanup complete.")